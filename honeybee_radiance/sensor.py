@@ -21,10 +21,15 @@ class Sensor(object):
     """
     __slots__ = ('_pos', '_dir')
 
-    def __init__(self, pos=None, dir=None):
+    def __init__(self, pos=None, dir=None, _trusted=False):
         """Create a sensor."""
-        self.pos = pos
-        self.dir = dir
+        if _trusted:
+            # the values are already validated tuples of 3 floats
+            self._pos = pos
+            self._dir = dir
+        else:
+            self.pos = pos
+            self.dir = dir
 
     @classmethod
     def from_dict(cls, sensor_dict):
@@ -131,10 +136,7 @@ class Sensor(object):
 
     def to_radiance(self):
         """Return Radiance string for a test point."""
-        return '%s %s' % (
-            ' '.join(str(v) for v in self.pos),
-            ' '.join(str(v) for v in self.dir)
-        )
+        return '%s %s %s %s %s %s' % (self._pos + self._dir)
 
     def to_dict(self):
         """Get the sensor as a dictionary.
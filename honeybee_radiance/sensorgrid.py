@@ -12,6 +12,7 @@ from ladybug_geometry.geometry3d.mesh import Mesh3D
 
 import os
 import math
+from itertools import islice
 try:
     from itertools import izip as zip
 except ImportError:  # python 3
@@ -101,7 +102,12 @@ class SensorGrid(object):
             positions: A list of (x, y ,z) for position of sensors.
             plane_normal: (x, y, z) for direction of sensors.
         """
-        sg = (Sensor(l, plane_normal) for l in positions)
+        # validate the shared normal once and reuse the same tuple for all sensors
+        normal = typing.tuple_with_length(plane_normal) \
+            if plane_normal is not None else (0, 0, 1)
+        sg = (Sensor(typing.tuple_with_length(l) if l is not None else (0, 0, 0),
+                     normal, _trusted=True)
+              for l in positions)
         return cls(identifier, sg)
 
     @classmethod
@@ -205,25 +211,18 @@ class SensorGrid(object):
         identifier = identifier or os.path.split(os.path.splitext(file_path)[0])[-1]
 
         start_line = int(start_line) if start_line is not None else 0
-        try:
-            end_line = int(end_line)
-        except TypeError:
-            end_line = float('+inf')
-
-        line_count = end_line - start_line + 1
+        end_line = int(end_line) + 1 if end_line is not None else None
 
         sensors = []
         with open(file_path, 'r') as inf:
-            for _ in range(start_line):
-                next(inf)
-
-            for count, l in enumerate(inf):
-                if not count < line_count:
-                    break
-                if not l or l[0] == '#':
+            for l in islice(inf, start_line, end_line):
+                if l[0] == '#':
                     # commented line
                     continue
-                sensors.append(Sensor.from_raw_values(*l.split()))
+                values = l.split()
+                if values:
+                    # lines with only a position get the default direction
+                    sensors.append(Sensor(values[:3], values[3:] or None))
 
         return cls(identifier, sensors)
 
@@ -269,12 +268,12 @@ class SensorGrid(object):
     @property
     def positions(self):
         """Get a generator of sensor positions as x, y, z."""
-        return (ap.position for ap in self.sensors)
+        return (sen.pos for sen in self._sensors)
 
     @property
     def directions(self):
         """Get a generator of sensor directions as x, y , z."""
-        return (ap.direction for ap in self.sensors)
+        return (sen.dir for sen in self._sensors)
 
     @property
     def count(self):
@@ -445,7 +444,7 @@ class SensorGrid(object):
 
     def to_radiance(self):
         """Return sensors grid as a Radiance string."""
-        return "\n".join((ap.to_radiance() for ap in self._sensors))
+        return _sensors_to_radiance(self._sensors)
 
     def to_file(self, folder, file_name=None, mkdir=False, ignore_group=False):
         """Write this sensor grid to a Radiance sensors file.
@@ -504,34 +503,23 @@ class SensorGrid(object):
             ]
         # calculate sensor count in each file
         sc = int(round(self.count / count))
-        sensors = iter(self._sensors)
-        for fc in range(count - 1):
-            name = '%s_%04d.pts' % (base_name, fc)
-            content = '\n'.join((next(sensors).to_radiance() for _ in range(sc)))
-            futil.write_to_file_by_name(folder, name, content + '\n', mkdir)
-
-        # write whatever is left to the last file
-        name = '%s_%04d.pts' % (base_name, count - 1)
-        content = '\n'.join((sensor.to_radiance() for sensor in sensors))
-        futil.write_to_file_by_name(folder, name, content + '\n', mkdir)
-
         grids_info = []
-
-        for c in range(count):
-            name = '%s_%04d' % (base_name, c)
+        for fc in range(count):
+            name = '%s_%04d' % (base_name, fc)
             path = '%s.pts' % name
-            full_path = os.path.join(folder, path)
+            # write whatever is left to the last file
+            end = (fc + 1) * sc if fc < count - 1 else None
+            sensors = self._sensors[fc * sc:end]
+            full_path = futil.write_to_file_by_name(
+                folder, path, _sensors_to_radiance(sensors) + '\n', mkdir)
 
             grids_info.append({
                 'name': name,
                 'path': path,
                 'full_path': full_path,
-                'count': sc
+                'count': len(sensors)
             })
 
-        # adjust the count for the last grid
-        grids_info[-1]['count'] = self.count - sc * (count - 1)
-
         return grids_info
 
     def to_dict(self):
@@ -715,3 +703,8 @@ class SensorGrid(object):
     def __repr__(self):
         """Get the string representation of the sensor grid."""
         return 'SensorGrid: {} [{} sensors]'.format(self.display_name, len(self.sensors))
+
+
+def _sensors_to_radiance(sensors):
+    """Get a Radiance string for a collection of sensors with one sensor per line."""
+    return '\n'.join(sen.to_radiance() for sen in sensors)
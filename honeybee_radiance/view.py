@@ -4,7 +4,6 @@ from __future__ import division
 
 from .lightpath import light_path_from_room
 
-from honeybee_radiance_command.cutil import parse_radiance_options
 from honeybee_radiance_command.options import TupleOption, \
     StringOptionJoined, NumericOption
 import honeybee.typing as typing
@@ -15,6 +14,24 @@ import ladybug.futil as futil
 import math
 import os
 
+# view options that can be loaded from a string mapped to View keys and value lengths
+_VIEW_OPTIONS = {
+    'vp': ('position', 3), 'vd': ('direction', 3), 'vu': ('up_vector', 3),
+    'vh': ('h_size', 1), 'vv': ('v_size', 1), 'vs': ('shift', 1), 'vl': ('lift', 1),
+    'vo': ('fore_clip', 1), 'va': ('aft_clip', 1)
+}
+# templates for translating the view options to a Radiance string for each view type
+_VIEW_BASE_FMTS = {
+    vt: '-vt%s -vp %%s %%s %%s -vd %%s %%s %%s -vu %%s %%s %%s' % vt
+    for vt in ('v', 'h', 'l', 'c', 'a', 's')
+}
+# fisheye views are almost always 180 degrees and their size can be written as is
+_VIEW_FISHEYE_FMTS = {
+    vt: '-vt%s -vp %%s %%s %%s -vd %%s %%s %%s -vu %%s %%s %%s -vh 180.0 -vv 180.0' % vt
+    for vt in ('h', 'a', 's')
+}
+_VIEW_OPTIONAL_FMTS = ('-vh %s', '-vv %s', '-vs %s', '-vl %s', '-vo %s', '-va %s')
+
 
 class View(object):
     u"""A Radiance view.
@@ -108,29 +125,41 @@ class View(object):
     __slots__ = ('_identifier', '_display_name', '_position', '_direction',
                  '_up_vector', '_h_size', '_v_size', '_shift', '_lift',
                  '_type', '_fore_clip', '_aft_clip', '_room_identifier',
-                 '_light_path', '_group_identifier')
+                 '_light_path', '_group_identifier', '_hv_ratio')
 
     def __init__(self, identifier, position=None, direction=None, up_vector=None,
-                 type='v', h_size=60, v_size=60, shift=None, lift=None):
+                 type='v', h_size=60, v_size=60, shift=None, lift=None, _trusted=False):
         u"""Create a view."""
-        self.identifier = identifier
         self._display_name = None
-        self._position = TupleOption(
-            'vp', 'view position', position if position is not None else (0, 0, 0)
-        )
-        self._direction = TupleOption(
-            'vd', 'view direction', direction if direction is not None else (0, 0, 1)
-        )
-        self._up_vector = TupleOption(
-            'vu', 'view up vector', up_vector if up_vector is not None else (0, 1, 0)
-        )
-        self._h_size = NumericOption('vh', 'view horizontal size', h_size, min_value=0)
-        self._v_size = NumericOption('vv', 'view vertical size', v_size, min_value=0)
-        self._shift = NumericOption('vs', 'view shift', shift)
-        self._lift = NumericOption('vl', 'view lift', lift)
+        self._position = TupleOption('vp', 'view position')
+        self._direction = TupleOption('vd', 'view direction')
+        self._up_vector = TupleOption('vu', 'view up vector')
+        self._h_size = NumericOption('vh', 'view horizontal size', min_value=0)
+        self._v_size = NumericOption('vv', 'view vertical size', min_value=0)
+        self._shift = NumericOption('vs', 'view shift')
+        self._lift = NumericOption('vl', 'view lift')
         self._type = StringOptionJoined(
-            'vt', 'view type', type, valid_values=['v', 'h', 'l', 'c', 'a', 's']
+            'vt', 'view type', valid_values=['v', 'h', 'l', 'c', 'a', 's']
         )
+        if _trusted:
+            # the values are taken from an existing View and are already validated
+            # see _set_option_values for the dependency on honeybee_radiance_command
+            self._identifier = identifier
+            _set_option_values(
+                (self._position, self._direction, self._up_vector, self._h_size,
+                 self._v_size, self._shift, self._lift, self._type),
+                (position, direction, up_vector, h_size, v_size, shift, lift, type)
+            )
+        else:
+            self.identifier = identifier
+            self._position.value = position if position is not None else (0, 0, 0)
+            self._direction.value = direction if direction is not None else (0, 0, 1)
+            self._up_vector.value = up_vector if up_vector is not None else (0, 1, 0)
+            self._h_size.value = h_size
+            self._v_size.value = v_size
+            self._shift.value = shift
+            self._lift.value = lift
+            self._type.value = type
         # set for_clip to None
         self._fore_clip = NumericOption('vo', 'view fore clip')
         self._aft_clip = NumericOption('va', 'view aft clip')
@@ -138,6 +167,7 @@ class View(object):
         self._room_identifier = None
         self._group_identifier = None
         self._light_path = None
+        self._hv_ratio = None  # cached (type, h_size, v_size, ratio) for dimensions
 
     @property
     def identifier(self):
@@ -508,12 +538,6 @@ class View(object):
         This method is similar to from_string method for radiance parameters with the
         difference that all the parameters that are not related to view will be ignored.
         """
-        mapper = {
-            'identifier': identifier, 'vp': 'position', 'vd': 'direction',
-            'vu': 'up_vector', 'vh': 'h_size', 'vv': 'v_size', 'vs': 'shift',
-            'vl': 'lift', 'vo': 'fore_clip', 'va': 'aft_clip'
-        }
-
         base = {
             'type': 'View',
             'identifier': identifier,
@@ -529,16 +553,25 @@ class View(object):
             'aft_clip': None
         }
 
-        # parse the string here
-        options = parse_radiance_options(view_string)
-
-        for opt, value in options.items():
-            if opt in mapper:
-                base[mapper[opt]] = value
+        # scan the string for view options and skip the values of other options
+        tokens = view_string.split()
+        token_count = len(tokens)
+        i = 0
+        while i < token_count:
+            token = tokens[i]
+            i += 1
+            if token[:1] != '-' or not token[1:2].isalpha():
+                continue  # a value of an ignored option or text before the options
+            opt = token[1:]
+            if opt in _VIEW_OPTIONS:
+                key, length = _VIEW_OPTIONS[opt]
+                values = tokens[i:i + length]
+                i += length
+                base[key] = values if length != 1 else ''.join(values)
             elif opt[:2] == 'vt':
                 base['view_type'] = opt
             else:
-                print('%s is not a view parameter and is ignored.' % opt)
+                print('%s is not a view parameter and is ignored.' % opt.rstrip('+-'))
 
         return cls.from_dict(base)
 
@@ -572,11 +605,8 @@ class View(object):
         match Radiance defaults.
         """
         x, y = self.dimension_x_y(x_res, y_res)
-        return '-x %d -y %d -ld%s' % (
-            x, y,
-            '-' if (self.fore_clip.to_radiance() + self.aft_clip.to_radiance() == '')
-            else '+'
-        )
+        no_clip = self._fore_clip.value is None and self._aft_clip.value is None
+        return '-x %d -y %d -ld%s' % (x, y, '-' if no_clip else '+')
 
     def dimension_x_y(self, x_res=None, y_res=None):
         """Get dimensions for this view as x, y.
@@ -590,32 +620,39 @@ class View(object):
         if self.is_fisheye:
             return min(x_res, y_res), min(x_res, y_res)
 
-        vh = self.h_size.value
-        vv = self.v_size.value
-
-        if self.type == 'v':
-            hv_ratio = math.tan(math.radians(vh) / 2.0) / \
-                math.tan(math.radians(vv) / 2.0)
-        else:
-            hv_ratio = vh / vv
+        hv_ratio = self._aspect_ratio()
 
         # radiance keeps the largest max size and tries to scale the other size
         # to fit the aspect ratio. In case the size doesn't match it reverses
         # the process.
         if y_res <= x_res:
             new_x = int(round(hv_ratio * y_res))
-            if new_x <= x_res:
-                return new_x, y_res
-            else:
-                new_y = int(round(x_res / hv_ratio))
-                return x_res, new_y
+            return (new_x, y_res) if new_x <= x_res \
+                else (x_res, int(round(x_res / hv_ratio)))
+        new_y = int(round(x_res / hv_ratio))
+        return (x_res, new_y) if new_y <= y_res \
+            else (int(round(hv_ratio * y_res)), y_res)
+
+    def _aspect_ratio(self):
+        """Get the ratio between the horizontal and vertical size of the view.
+
+        The ratio is cached and only recalculated once the type or the size of the
+        view changes.
+        """
+        vt = self._type.value
+        vh = self._h_size.value
+        vv = self._v_size.value
+        cached = self._hv_ratio
+        if cached is not None and cached[:3] == (vt, vh, vv):
+            return cached[3]
+
+        if vt == 'v':
+            hv_ratio = math.tan(math.radians(vh) / 2.0) / \
+                math.tan(math.radians(vv) / 2.0)
         else:
-            new_y = int(round(x_res / hv_ratio))
-            if new_y <= y_res:
-                return x_res, new_y
-            else:
-                new_x = int(round(hv_ratio * y_res))
-                return new_x, y_res
+            hv_ratio = vh / vv
+        self._hv_ratio = (vt, vh, vv, hv_ratio)
+        return hv_ratio
 
     def grid(self, x_div_count=1, y_div_count=1):
         """Break-down the view into a grid of views based on x and y grid count.
@@ -629,7 +666,6 @@ class View(object):
         Returns:
             A tuple of views. Views are sorted row by row from right to left.
         """
-        PI = math.pi
         try:
             x_div_count = abs(x_div_count)
             y_div_count = abs(y_div_count)
@@ -642,53 +678,43 @@ class View(object):
             return [self]
 
         _views = list(range(x_div_count * y_div_count))
+        h_size = self._h_size.value
+        v_size = self._v_size.value
+        half_rad = math.pi / 360.  # half of a degree in radians
+        to_deg = 360. / math.pi  # twice the degrees in a radian
 
         if self.type == 'l':
             # parallel view (vtl)
-            _vh = self.h_size / x_div_count
-            _vv = self.v_size / y_div_count
+            _vh = h_size / x_div_count
+            _vv = v_size / y_div_count
 
         elif self.type == 'v':
             # perspective (vtv)
-            _vh = (2. * 180. / PI) * \
-                math.atan(((PI / 180. / 2.) * self.h_size) / x_div_count)
-            _vv = (2. * 180. / PI) * \
-                math.atan(math.tan((PI / 180. / 2.) * self.v_size) / y_div_count)
+            _vh = to_deg * math.atan((half_rad * h_size) / x_div_count)
+            _vv = to_deg * math.atan(math.tan(half_rad * v_size) / y_div_count)
 
         elif self.is_fisheye:
             # fish eye
-            _vh = (2. * 180. / PI) * \
-                math.asin(math.sin((PI / 180. / 2.) * self.h_size) / x_div_count)
-            _vv = (2. * 180. / PI) * \
-                math.asin(math.sin((PI / 180. / 2.) * self.v_size) / y_div_count)
+            _vh = to_deg * math.asin(math.sin(half_rad * h_size) / x_div_count)
+            _vv = to_deg * math.asin(math.sin(half_rad * v_size) / y_div_count)
 
         else:
             print("Grid views are not supported for %s." % self.type.to_radiance())
             return [self]
 
-        # create a set of new views
-        for view_count in range(len(_views)):
-            # calculate view shift and view lift
-            if x_div_count == 1:
-                _vs = 0
-            else:
-                _vs = (((view_count % x_div_count) / (x_div_count - 1)) - 0.5) \
-                    * (x_div_count - 1)
-
-            if y_div_count == 1:
-                _vl = 0
-            else:
-                _vl = ((int(view_count / y_div_count) / (y_div_count - 1)) - 0.5) \
-                    * (y_div_count - 1)
-
-            # create a copy from the current copy
-            _n_view = View('%s_%d' % (self.identifier, view_count))
+        shifts, lifts = _grid_shifts(x_div_count, y_div_count)
+        position = self._position.value
+        direction = self._direction.value
+        up_vector = self._up_vector.value
+        view_type = self._type.value
 
-            # update parameters
-            _n_view.h_size = _vh
-            _n_view.v_size = _vv
-            _n_view.shift = _vs
-            _n_view.lift = _vl
+        # create a set of new views
+        for view_count, (_vs, _vl) in enumerate(zip(shifts, lifts)):
+            # create a copy from the current view with the new size, shift and lift
+            _n_view = View(
+                '%s_%d' % (self.identifier, view_count), position, direction,
+                up_vector, view_type, _vh, _vv, _vs, _vl, _trusted=True
+            )
             _n_view._fore_clip = self._fore_clip
             _n_view._aft_clip = self._aft_clip
             _n_view._room_identifier = self._room_identifier
@@ -705,14 +731,23 @@ class View(object):
 
     def to_radiance(self):
         """Return full Radiance definition as a string."""
-        # create base information of view
-        view_options = ' '.join((
-            self.vt, self.vp, self.vd, self.vu,
-            self.vh, self.vv, self.vs, self.vl,
-            self.vo, self.va
-        ))
-
-        return ' '.join(view_options.split())  # remove white spaces
+        # format the raw values directly instead of calling each option's to_radiance
+        vt, vh, vv = self._type.value, self._h_size.value, self._v_size.value
+        values = self._position.value + self._direction.value + self._up_vector.value
+        if vh == vv == 180 and vt in _VIEW_FISHEYE_FMTS:
+            base = _VIEW_FISHEYE_FMTS[vt] % values
+            vh = vv = None  # the sizes are already in the base string
+        else:
+            base = _VIEW_BASE_FMTS[vt] % values
+        # only add the sizes and the optional options that are set
+        optional = (
+            vh, vv, self._shift.value, self._lift.value,
+            self._fore_clip.value, self._aft_clip.value
+        )
+        extra = ' '.join(
+            fmt % val for fmt, val in zip(_VIEW_OPTIONAL_FMTS, optional)
+            if val is not None)
+        return '%s %s' % (base, extra) if extra else base
 
     def info_dict(self, model=None):
         """Get a dictionary with information about the View.
@@ -776,7 +811,7 @@ class View(object):
 
         identifier = file_name or self.identifier + '.vf'
         # add rvu before the view itself
-        content = 'rvu ' + self.to_radiance()
+        content = 'rvu %s' % self.to_radiance()
         return futil.write_to_file_by_name(folder, identifier, content, mkdir)
 
     def move(self, moving_vec):
@@ -786,8 +821,9 @@ class View(object):
             moving_vec: A ladybug_geometry Vector3D with the direction and distance
                 to move the view.
         """
-        position = pv.Point3D(*self.position)
-        self.position = tuple(position.move(moving_vec))
+        p = self._position.value
+        self.position = (p[0] + moving_vec[0], p[1] + moving_vec[1],
+                         p[2] + moving_vec[2])
 
     def rotate(self, angle, axis=None, origin=None):
         """Rotate this view by a certain angle around an axis and origin.
@@ -799,15 +835,8 @@ class View(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated. If None, self.position is used. (Default: None).
         """
-        view_up_vector = pv.Vector3D(*self.up_vector)
-        view_position = pv.Point3D(*self.position)
-        view_direction = pv.Vector3D(*self.direction)
-        view_plane = Plane(n=view_up_vector, o=view_position, x=view_direction)
-        axis = axis if axis is not None else view_up_vector
-        position = origin if origin is not None else view_position
-
-        rotated_plane = view_plane.rotate(axis, math.radians(angle), position)
-        self._apply_plane_properties(rotated_plane, view_direction, view_up_vector)
+        axis = self._up_vector.value if axis is None else axis
+        self._apply_rotation(_rotation_matrix(axis, math.radians(angle)), origin)
 
     def rotate_xy(self, angle, origin=None):
         """Rotate this view counterclockwise in the world XY plane by a certain angle.
@@ -817,14 +846,7 @@ class View(object):
             origin: A ladybug_geometry Point3D for the origin around which the
                 object will be rotated. If None, self.position is used. (Default: None).
         """
-        view_up_vector = pv.Vector3D(*self.up_vector)
-        view_position = pv.Point3D(*self.position)
-        view_direction = pv.Vector3D(*self.direction)
-        view_plane = Plane(n=view_up_vector, o=view_position, x=view_direction)
-        position = origin if origin is not None else view_position
-
-        rotated_plane = view_plane.rotate_xy(math.radians(angle), position)
-        self._apply_plane_properties(rotated_plane, view_direction, view_up_vector)
+        self._apply_rotation(_rotation_matrix((0, 0, 1), math.radians(angle)), origin)
 
     def reflect(self, plane):
         """Reflect this view across a plane.
@@ -849,10 +871,33 @@ class View(object):
             origin: A ladybug_geometry Point3D representing the origin from which
                 to scale. If None, it will be scaled from the World origin (0, 0, 0).
         """
-        view_position = pv.Point3D(*self.position)
-        self.position = view_position.scale(factor, origin)
-        self.direction = pv.Vector3D(*self.direction) * factor
-        self.up_vector = pv.Vector3D(*self.up_vector) * factor
+        p = self._position.value
+        if origin is None:
+            self.position = (p[0] * factor, p[1] * factor, p[2] * factor)
+        else:
+            self.position = (
+                (p[0] - origin[0]) * factor + origin[0],
+                (p[1] - origin[1]) * factor + origin[1],
+                (p[2] - origin[2]) * factor + origin[2]
+            )
+        d, u = self._direction.value, self._up_vector.value
+        self.direction = (d[0] * factor, d[1] * factor, d[2] * factor)
+        self.up_vector = (u[0] * factor, u[1] * factor, u[2] * factor)
+
+    def _apply_rotation(self, matrix, origin=None):
+        """Rotate the position, direction and up_vector with a 3x3 rotation matrix.
+
+        The position is rotated around the origin, which defaults to the view
+        position itself when None.
+        """
+        if origin is not None:
+            p = self._position.value
+            rel_pos = _apply_matrix(
+                matrix, (p[0] - origin[0], p[1] - origin[1], p[2] - origin[2]))
+            self.position = (rel_pos[0] + origin[0], rel_pos[1] + origin[1],
+                             rel_pos[2] + origin[2])
+        self.direction = _apply_matrix(matrix, self._direction.value)
+        self.up_vector = _apply_matrix(matrix, self._up_vector.value)
 
     def _apply_plane_properties(self, plane, view_direction, view_up_vector):
         """Re-set the position, direction and up_vector from a Plane.
@@ -870,11 +915,16 @@ class View(object):
 
     def __copy__(self):
         new_obj = View(
-            self.identifier, position=self.position, direction=self.direction,
-            up_vector=self.up_vector, type=self.type, h_size=self.h_size,
-            v_size=self.v_size, shift=self.shift, lift=self.lift)
+            self._identifier, self._position.value, self._direction.value,
+            self._up_vector.value, self._type.value, self._h_size.value,
+            self._v_size.value, self._shift.value, self._lift.value, _trusted=True)
+        _set_option_values(
+            (new_obj._fore_clip, new_obj._aft_clip),
+            (self._fore_clip.value, self._aft_clip.value)
+        )
         new_obj._display_name = self._display_name
         new_obj._room_identifier = self._room_identifier
+        new_obj._group_identifier = self._group_identifier
         new_obj._light_path = self._light_path
         return new_obj
 
@@ -902,3 +952,76 @@ class View(object):
     def __repr__(self):
         """View representation."""
         return self.to_radiance()
+
+
+def _grid_shifts(x_div_count, y_div_count):
+    """Get the view shift and view lift of each cell in a grid of views.
+
+    Args:
+        x_div_count: Number of divisions in x direction.
+        y_div_count: Number of divisions in y direction.
+
+    Returns:
+        A tuple with two lists of x_div_count * y_div_count values for the view
+        shifts and the view lifts. Cells are ordered row by row.
+    """
+    # calculate view shift for each column and view lift for each row only once
+    if x_div_count == 1:
+        col_shifts = [0.]
+    else:
+        col_shifts = [(c / (x_div_count - 1) - 0.5) * (x_div_count - 1)
+                      for c in range(x_div_count)]
+    if y_div_count == 1:
+        row_lifts = [0.]
+    else:
+        row_lifts = [(r / (y_div_count - 1) - 0.5) * (y_div_count - 1)
+                     for r in range(y_div_count)]
+
+    shifts = col_shifts * y_div_count
+    lifts = [lift for lift in row_lifts for _ in range(x_div_count)]
+    return shifts, lifts
+
+
+def _set_option_values(options, values):
+    """Assign already validated values to options without running their validation.
+
+    This is the only place that writes the private ``_value`` slot of the
+    honeybee_radiance_command Option classes (Option.__slots__). Those options do
+    not expose a public way to skip validation, so if the slot is ever renamed
+    upstream this function is the single place to update.
+
+    Args:
+        options: A list of honeybee_radiance_command Options.
+        values: A list of values with the same length as the options.
+    """
+    for opt, val in zip(options, values):
+        opt._value = val
+
+
+def _rotation_matrix(axis, angle):
+    """Get a 3x3 matrix for rotating vectors around an axis using Rodrigues' formula.
+
+    Args:
+        axis: A vector as (x, y, z) for the rotation axis. It does not need to be
+            unitized.
+        angle: An angle for rotation in radians.
+    """
+    mag = math.sqrt(axis[0] ** 2 + axis[1] ** 2 + axis[2] ** 2)
+    x, y, z = axis[0] / mag, axis[1] / mag, axis[2] / mag
+    c, s = math.cos(angle), math.sin(angle)
+    t = 1 - c
+    return (
+        (c + t * x * x, t * x * y - s * z, t * x * z + s * y),
+        (t * x * y + s * z, c + t * y * y, t * y * z - s * x),
+        (t * x * z - s * y, t * y * z + s * x, c + t * z * z)
+    )
+
+
+def _apply_matrix(matrix, vec):
+    """Multiply a 3x3 matrix by an (x, y, z) vector and return the result as a tuple."""
+    r0, r1, r2 = matrix
+    return (
+        r0[0] * vec[0] + r0[1] * vec[1] + r0[2] * vec[2],
+        r1[0] * vec[0] + r1[1] * vec[1] + r1[2] * vec[2],
+        r2[0] * vec[0] + r2[1] * vec[1] + r2[2] * vec[2]
+    )
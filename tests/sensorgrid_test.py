@@ -57,6 +57,20 @@ def test_from_planar_positions():
         assert sensor.dir == (0, 0, 1)
 
 
+def test_from_planar_positions_shared_normal():
+    positions = [[0, 0, 0], [0, 0, 5], [0, 0, 10]]
+    sg = SensorGrid.from_planar_positions('test_grid', positions, [1, 0, 0])
+    assert tuple(sg.directions) == ((1.0, 0.0, 0.0),) * 3
+    assert all(isinstance(v, float) for v in sg.sensors[0].dir)
+    assert tuple(sg.positions) == ((0, 0, 0), (0, 0, 5), (0, 0, 10))
+
+
+def test_from_planar_positions_defaults():
+    sg = SensorGrid.from_planar_positions('test_grid', [[0, 0, 5], None], None)
+    assert tuple(sg.directions) == ((0, 0, 1), (0, 0, 1))
+    assert tuple(sg.positions) == ((0, 0, 5), (0, 0, 0))
+
+
 def test_from_loc_dir():
     positions = [[0, 0, 0], [0, 0, 5], [0, 0, 10]]
     directions = [[0, 0, 1], [0, 0, -1], [0, 0, 10]]
@@ -87,6 +101,15 @@ def test_from_file():
     assert sensor_grid[2].to_radiance() == '-10.0 -5.0 0.0 -50.0 -60.0 -70.0'
 
 
+def test_from_file_partial_lines():
+    sensor_grid = SensorGrid.from_file('./tests/assets/test_points_partial.pts')
+    assert len(sensor_grid) == 3  # blank lines are skipped
+    assert sensor_grid[0].pos == (1, 1, 1)
+    assert sensor_grid[0].dir == (0, 0, 1)
+    assert sensor_grid[1].to_radiance() == '0.2 0.3 0.4 0.5 0.6 0.7'
+    assert sensor_grid[2].dir == (0, 0, 1)
+
+
 def test_move():
     sensor = Sensor((0, 0, 10), (0, 0, -1))
     sensors = [Sensor((0, 0, 0), (0, 0, 1)), Sensor((0, 0, 10), (0, 0, 1)), sensor]
@@ -195,3 +218,21 @@ def test_split_grid():
         assert info[i]['count'] == 4
 
     assert info[-1]['count'] == 1
+
+
+def test_split_grid_more_chunks_than_sensors():
+    """Test splitting a grid where the rounded chunk size runs out before the end."""
+    sensor_grid = SensorGrid.from_planar_positions(
+        'sg', [(i, 0, 0) for i in range(9)], (0, 0, 1))
+    folder = './tests/assets/temp'
+    info = sensor_grid.to_files(folder, 6, 'test_sensor_grid_9')
+    assert [inf['count'] for inf in info] == [2, 2, 2, 2, 1, 0]
+    for inf in info:
+        with open(inf['full_path']) as f:
+            assert len([l for l in f if l.strip()]) == inf['count']
+
+
+def test_positions_and_directions():
+    sg = SensorGrid('sg', sensors)
+    assert list(sg.positions) == [(0, 0, 0), (0, 0, 10)]
+    assert list(sg.directions) == [(0, 0, 1), (0, 0, 1)]
@@ -76,6 +76,12 @@ def test_dimensions():
     assert view.dimension(512, 512) == '-x 512 -y 122 -ld-'
 
 
+def test_dimensions_zero_size():
+    for view_type in ('v', 'l'):
+        view = View('test_view', type=view_type, h_size=0, v_size=60)
+        assert view.dimension_x_y(512, 512) == (0, 512)
+
+
 def test_move():
     v = View('test_view')
     v.move(pv.Vector3D(10, 20, 30))
@@ -160,6 +166,28 @@ def test_from_string():
     assert vw.aft_clip == 200
 
 
+def test_from_string_missing_size():
+    vw = View.from_string('test_view', '-vtl -vp 0 0 1 -vd 0 1 0 -vv 30')
+    assert vw.h_size.value is None
+    assert vw.to_radiance() == \
+        '-vtl -vp 0.0 0.0 1.0 -vd 0.0 1.0 0.0 -vu 0.0 1.0 0.0 -vv 30.0'
+
+
+def test_from_string_ignored_options(capsys):
+    view = 'rvu -vtv -ab 2 -vp 1 2 3 -dj -0.5 -vd 0 1 0 -ld- -vh 40 -I+ -vv 30 ' \
+        '-vs -0.5'
+    vw = View.from_string('test_view', view)
+    assert list(vw.position) == [1, 2, 3]
+    assert list(vw.direction) == [0, 1, 0]
+    assert vw.h_size == 40
+    assert vw.v_size == 30
+    assert vw.shift == -0.5
+    assert vw.lift.value is None
+
+    ignored = [line.split()[0] for line in capsys.readouterr().out.splitlines()]
+    assert ignored == ['ab', 'dj', 'ld', 'I']
+
+
 def test_from_file():
     vw = View.from_file('./tests/assets/view.vf')
     assert vw.identifier == 'view'
@@ -182,3 +210,64 @@ def test_to_from_dict():
     new_view = View.from_dict(view_dict)
     assert new_view == view
     assert view_dict == new_view.to_dict()
+
+
+def test_grid():
+    v = View('test_view', (0, 0, 10), (0, 1, 0), (0, 0, 1))
+    views = v.grid(3, 2)
+    assert len(views) == 6
+    assert all(vw.position == (0, 0, 10) for vw in views)
+    assert all(vw.direction == (0, 1, 0) for vw in views)
+    assert all(vw.up_vector == (0, 0, 1) for vw in views)
+    assert [vw.shift for vw in views] == [-1, 0, 1, -1, 0, 1]
+    assert [vw.lift for vw in views] == [-0.5, -0.5, -0.5, 0.5, 0.5, 0.5]
+    assert views[0].identifier == 'test_view_0'
+
+    v = View('test_view', type='l', h_size=10, v_size=20)
+    views = v.grid(2, 2)
+    assert views[0].h_size == 5
+    assert views[0].v_size == 10
+
+
+def test_trusted_init():
+    view = View('test_view', (0, 0, 10), (0, 1, 0), (0, 0, 1), 'l', 240, 300, -10, -25)
+    options = ('position', 'direction', 'up_vector', 'type', 'h_size', 'v_size',
+               'shift', 'lift')
+    # trusted values must come from an already validated view
+    values = [getattr(view, '_' + opt).value for opt in options]
+    trusted = View('test_view', *values, _trusted=True)
+    assert trusted.identifier == 'test_view'
+    for opt, val in zip(options, values):
+        assert getattr(trusted, '_' + opt).value == val
+        assert getattr(trusted, '_' + opt).to_radiance() == \
+            getattr(view, '_' + opt).to_radiance()
+    assert trusted._fore_clip.value is None
+    assert trusted._aft_clip.value is None
+    assert trusted.to_radiance() == view.to_radiance()
+
+    view.fore_clip = 30
+    view.aft_clip = 50
+    new_view = view.duplicate()
+    assert new_view.fore_clip == 30
+    assert new_view.aft_clip == 50
+    assert new_view._fore_clip.to_radiance() == '-vo 30.0'
+    assert new_view._aft_clip.to_radiance() == '-va 50.0'
+    assert new_view.to_radiance() == view.to_radiance()
+
+
+def test_duplicate():
+    view = View('test_view', (0, 0, 10), (0, 1, 0), (0, 0, 1), 'l', 240, 300, -10, -25)
+    view.fore_clip = 30
+    view.aft_clip = 50
+    view.group_identifier = 'floor_1'
+
+    new_view = view.duplicate()
+    assert new_view == view
+    assert new_view.to_radiance() == view.to_radiance()
+    assert new_view.group_identifier == 'floor_1'
+
+    new_view.position = (0, 0, 20)
+    new_view.fore_clip = 10
+    assert view.position == (0, 0, 10)
+    assert view.fore_clip == 30
+